@@ -17,7 +17,7 @@ export const DemoControlPanel = () => {
   }
 
   return (
-    <div className="fixed bottom-4 right-4 bg-gray-900 text-white p-4 rounded-lg shadow-2xl z-50 w-96 border border-gray-600">
+    <div className="fixed bottom-4 right-4 bg-gray-900 text-white p-4 rounded-lg shadow-2xl z-50 w-96 border border-gray-600" data-testid="demo-controls">
       <div className="flex justify-between items-center mb-3">
         <h3 className="text-lg font-bold text-blue-300">Demo Controls</h3>
         <Button variant="ghost" size="icon-md" onClick={handleExit} title="Exit demo" className="text-red-400 hover:text-red-300">
@@ -11,7 +11,7 @@ export const DemoProgress = () => {
   }
 
   return (
-    <div className="fixed top-0 left-0 right-0 h-2 z-50">
+    <div className="fixed top-0 left-0 right-0 h-2 z-50" data-testid="demo-progress">
       <Progress value={demoProgress.percentComplete} className="w-full" />
     </div>
   );
@@ -22,7 +22,7 @@ export const DemoSelector = () => {
   return (
     <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
       {demoScenarios.map(scenario => (
-        <Card key={scenario.id}>
+        <Card key={scenario.id} data-testid="demo-card">
           <CardHeader>
             <CardTitle>{scenario.name}</CardTitle>
             <CardDescription>{scenario.description}</CardDescription>
@@ -31,7 +31,7 @@ export const DemoSelector = () => {
             <p>Expected duration: {scenario.expectedDuration} minutes</p>
           </CardContent>
           <CardFooter>
-            <Button onClick={() => handleStartDemo(scenario.id)}>Start Demo</Button>
+            <Button onClick={() => handleStartDemo(scenario.id)} data-testid="start-demo">Start Demo</Button>
           </CardFooter>
         </Card>
       ))}
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Shared Playwright fixtures for the demo tests. One Chromium instance is
+# launched per session (per worker under `pytest -n auto`), each test module
+# shares one context so the HTTP cache stays warm, and each test gets a fresh
+# page with cookies and storage reset afterwards. The context must not use
+# context.route(): Playwright disables the HTTP cache whenever routing is on.
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+from demo_helpers import APP_ORIGIN, STORAGE_RESET_URL
+
+def pytest_collection_modifyitems(items):
+    # The browser lives on the session event loop, so every test must run there too
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+# Only flags Playwright doesn't already pass; it launches Chromium without the
+# sandbox, extensions or background networking and off /dev/shm by default
+CHROMIUM_ARGS = [
+    # None of the tests look at images, so don't load them. Done with a launch
+    # flag rather than request routing so the HTTP cache stays enabled; web
+    # fonts are left to that cache.
+    "--blink-settings=imagesEnabled=false",
+    # The demo pages need no GPU rendering
+    "--disable-gpu",
+]
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        yield browser
+        await browser.close()
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def context(browser):
+    context = await browser.new_context()
+    yield context
+    await context.close()
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def reset_context(context):
+    yield
+    await context.clear_cookies()
+    await context.clear_permissions()
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(context):
+    page = await context.new_page()
+    yield page
+    visited_app = page.url.startswith(APP_ORIGIN)
+    # Closing the page first stops a demo that is still typing, so the form
+    # can't write its state back after the clear below
+    await page.close()
+    # localStorage outlives the page in a shared context, and the shipping
+    # form persists its state there; clear it so demos start from empty fields
+    if visited_app:
+        cleanup = await context.new_page()
+        await cleanup.goto(STORAGE_RESET_URL)
+        await cleanup.evaluate("() => localStorage.clear()")
+        await cleanup.close()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import os
+
+# Happy-path screenshots are only taken with DEMO_DEBUG_SHOTS=1; failure
+# screenshots are always taken.
+DEBUG_SHOTS = os.getenv("DEMO_DEBUG_SHOTS") == "1"
+
+# Lossy viewport captures are much cheaper to encode and store than PNG, and
+# nothing compares these screenshots pixel by pixel.
+SCREENSHOT_OPTIONS = {"type": "jpeg", "quality": 60, "full_page": False}
+
+# Reads the current value of every selector in a single page.evaluate call,
+# instead of one input_value() round-trip per field. Missing elements come
+# back as None so callers can tell "not found" apart from "empty".
+READ_VALUES_JS = """
+sels => sels.map(s => {
+    const el = document.querySelector(s);
+    return el ? el.value : null;
+})
+"""
+
+async def read_values(page, selectors):
+    return await page.evaluate(READ_VALUES_JS, list(selectors))
+
+APP_ORIGIN = "http://localhost:3000"
+DEMO_URL = f"{APP_ORIGIN}/demo"
+
+# Cheap JSON endpoint on the app's origin, used to reach its localStorage
+# without loading a full page
+STORAGE_RESET_URL = f"{APP_ORIGIN}/api/health"
+
+# The tests wait for the Start Demo buttons anyway, so there is no need to
+# hold the navigation until the network goes idle. "load" rather than
+# "domcontentloaded": the buttons are server-rendered and would be visible
+# before the client bundle has hydrated them, swallowing an early click.
+async def goto_demo(page):
+    await page.goto(DEMO_URL, wait_until="load")
+    await page.get_by_test_id("start-demo").first.wait_for(state="visible", timeout=5000)
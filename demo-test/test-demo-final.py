@@ -1,110 +1,164 @@
 #!/usr/bin/env python3
 
-import asyncio
-from playwright.async_api import async_playwright
-
-async def test_demo_comprehensive():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
-        
+from playwright.async_api import expect
+import pytest
+import sys
+from demo_helpers import DEBUG_SHOTS, SCREENSHOT_OPTIONS, goto_demo, read_values
+
+# Demo cards in the order DemoSelector renders them, with the origin values
+# each scenario types in lib/demo/demo-data.ts (None when it doesn't target
+# the #origin-* fields)
+DEMOS = [
+    ("manufacturing", {"Company": "Heavy Industries Inc.", "ZIP": "48201"}),
+    ("healthcare", None),
+]
+
+# Upper bound for the demo to finish typing the origin ZIP, counted from
+# arrival on /shipping. The manufacturing demo starts typing it ~21s after
+# Start Demo is clicked, so this leaves headroom for a slow dev server.
+FIELD_FILL_TIMEOUT = 35000
+
+# Origin fields checked after a demo has run
+FIELDS_TO_CHECK = {
+    "Contact Name": "#origin-contact-name",
+    "Company": "#origin-contact-company",
+    "Phone": "#origin-contact-phone",
+    "Email": "#origin-contact-email",
+    "Address": "#origin-address",
+    "City": "#origin-city",
+    "State": "#origin-state",
+    "ZIP": "#origin-zip"
+}
+
+# Page-level stats gathered in the browser in a single round-trip
+PAGE_STATS_JS = """
+() => ({
+    title: document.title,
+    heading: document.querySelector('h1')?.innerText ?? null,
+    cards: document.querySelectorAll('[data-testid="demo-card"]').length,
+    startButtons: document.querySelectorAll('[data-testid="start-demo"]').length,
+})
+"""
+
+# First 1000 characters of the page body, and whether anything was cut off
+PAGE_PREVIEW_JS = """
+() => {
+    const html = document.body.innerHTML;
+    return { html: html.slice(0, 1000), truncated: html.length > 1000 };
+}
+"""
+
+async def run_demo(page, demo_index, name, expected=None):
+    await goto_demo(page)
+
+    # Start the demo and let it drive the shipping form
+    print(f"✅ Starting {name} demo...")
+    await page.get_by_test_id("start-demo").nth(demo_index).click()
+    if DEBUG_SHOTS:
+        await page.screenshot(path=f"demo_{name}_started.jpg", **SCREENSHOT_OPTIONS)
+
+    print("⏳ Waiting for navigation to shipping page...")
+    await page.wait_for_url("**/shipping", timeout=5000)
+    print(f"✅ Navigated to: {page.url}")
+    if DEBUG_SHOTS:
+        await page.screenshot(path=f"demo_{name}_shipping_form.jpg", **SCREENSHOT_OPTIONS)
+
+    # The ZIP is the last origin field the demo types. Wait for its full
+    # value, not just the first keystroke, so every earlier field is complete.
+    print("🔍 Checking if demo is filling form fields...")
+    if expected is not None:
         try:
-            print("🚀 Running comprehensive demo system test...")
-            
-            # Test 1: Demo page loads correctly
-            print("\n📍 Test 1: Demo Page Loading")
-            await page.goto("http://localhost:3000/demo", wait_until="networkidle")
-            
-            title = await page.title()
-            heading = await page.locator("h1").inner_text()
-            demo_cards = await page.locator(".grid .card, [class*='card']").count()
-            start_buttons = await page.locator("button:has-text('Start Demo')").count()
-            
-            print(f"   ✅ Page title: {title}")
-            print(f"   ✅ Heading: {heading}")
-            print(f"   ✅ Demo cards: {demo_cards}")
-            print(f"   ✅ Start buttons: {start_buttons}")
-            
-            # Test 2: Demo starts and navigates correctly
-            print("\n📍 Test 2: Demo Start and Navigation")
-            manufacturing_button = page.locator("button:has-text('Start Demo')").first
-            await manufacturing_button.click()
-            
-            # Wait for navigation
-            await page.wait_for_url("**/shipping", timeout=10000)
-            current_url = page.url
-            print(f"   ✅ Navigated to: {current_url}")
-            
-            # Test 3: Demo fills form fields correctly
-            print("\n📍 Test 3: Form Field Automation")
-            await page.wait_for_timeout(8000)  # Wait for demo actions
-            
-            # Check all filled fields
-            fields_to_check = {
-                "Contact Name": "#origin-contact-name",
-                "Company": "#origin-contact-company", 
-                "Phone": "#origin-contact-phone",
-                "Email": "#origin-contact-email",
-                "Address": "#origin-address",
-                "City": "#origin-city",
-                "State": "#origin-state",
-                "ZIP": "#origin-zip"
-            }
-            
-            filled_fields = {}
-            for field_name, selector in fields_to_check.items():
-                try:
-                    value = await page.locator(selector).input_value()
-                    filled_fields[field_name] = value
-                    status = "✅" if value else "❌"
-                    print(f"   {status} {field_name}: '{value}'")
-                except:
-                    print(f"   ❌ {field_name}: Field not found")
-                    
-            # Test 4: Demo controls and UI elements
-            print("\n📍 Test 4: Demo UI Elements")
-            
-            # Check for demo mode indicator
-            demo_in_progress = await page.locator("text=Demo in progress").count() > 0
-            print(f"   ✅ Demo mode active: {demo_in_progress}")
-            
-            # Take final screenshots
-            await page.screenshot(path="demo_final_test.png")
-            print("   ✅ Final screenshot saved")
-            
-            # Test 5: Healthcare Demo
-            print("\n📍 Test 5: Healthcare Demo Test")
-            await page.goto("http://localhost:3000/demo")
-            healthcare_button = page.locator("button:has-text('Start Demo')").nth(1)
-            if await healthcare_button.count() > 0:
-                await healthcare_button.click()
-                await page.wait_for_url("**/shipping", timeout=10000)
-                await page.wait_for_timeout(5000)
-                
-                # Check healthcare demo fields
-                healthcare_company = await page.locator("#origin-contact-company").input_value()
-                print(f"   ✅ Healthcare demo company: '{healthcare_company}'")
-            
-            # Summary
-            print("\n📊 Test Summary:")
-            filled_count = sum(1 for v in filled_fields.values() if v)
-            total_fields = len(fields_to_check)
-            success_rate = (filled_count / total_fields) * 100
-            
-            print(f"   Fields filled: {filled_count}/{total_fields} ({success_rate:.1f}%)")
-            
-            if success_rate >= 80:
-                print("   🎉 DEMO SYSTEM IS WORKING SUCCESSFULLY!")
-            else:
-                print("   ⚠️  Demo system needs improvement")
-                
-        except Exception as e:
-            print(f"❌ Error during comprehensive test: {e}")
-            await page.screenshot(path="demo_final_error.png")
-            
-        finally:
-            await browser.close()
+            await expect(page.locator(FIELDS_TO_CHECK["ZIP"])).to_have_value(expected["ZIP"], timeout=FIELD_FILL_TIMEOUT)
+        except AssertionError:
+            print("   ⚠️  Demo did not finish typing the origin ZIP field")
+
+    values = await read_values(page, FIELDS_TO_CHECK.values())
+    filled_fields = {}
+    for field_name, value in zip(FIELDS_TO_CHECK, values):
+        if value is None:
+            print(f"   ❌ {field_name}: Field not found")
+            continue
+        filled_fields[field_name] = value
+        status = "✅" if value else "❌"
+        print(f"   {status} {field_name}: '{value}'")
+
+    if DEBUG_SHOTS:
+        await page.screenshot(path=f"demo_{name}_form_filled.jpg", **SCREENSHOT_OPTIONS)
+
+    return filled_fields
+
+async def test_demo_page_structure(page):
+    try:
+        print("🚀 Testing demo page structure...")
+        await goto_demo(page)
+
+        # Take screenshot of initial state
+        if DEBUG_SHOTS:
+            await page.screenshot(path="demo_initial.jpg", **SCREENSHOT_OPTIONS)
+
+        # Collect the page-level stats in one round-trip
+        stats = await page.evaluate(PAGE_STATS_JS)
+        print(f"   ✅ Page title: {stats['title']}")
+        print(f"   {'✅' if stats['heading'] else '❌'} Heading: {stats['heading']}")
+        print(f"   ✅ Demo cards: {stats['cards']}")
+        print(f"   ✅ Start buttons: {stats['startButtons']}")
+
+        button_count = stats['startButtons']
+        if button_count < len(DEMOS):
+            print("❌ Missing Start Demo buttons - checking page source...")
+            # Slice in the browser so only the preview crosses the wire
+            preview = await page.evaluate(PAGE_PREVIEW_JS)
+            print("📝 Page content preview:")
+            print(preview['html'] + "..." if preview['truncated'] else preview['html'])
+
+        assert button_count >= len(DEMOS), f"Expected {len(DEMOS)} Start Demo buttons, found {button_count}"
+
+    except Exception as e:
+        print(f"❌ Error during page structure test: {e}")
+        await page.screenshot(path="demo_error.jpg", **SCREENSHOT_OPTIONS)
+        raise
+
+@pytest.mark.parametrize("demo_index", range(len(DEMOS)), ids=[name for name, _ in DEMOS])
+async def test_demo_workflow(page, demo_index):
+    name, expected = DEMOS[demo_index]
+
+    try:
+        print(f"🚀 Testing {name} demo workflow...")
+        filled_fields = await run_demo(page, demo_index, name, expected)
+
+        # Scenarios that don't target the origin fields only need to reach the form
+        if expected is None:
+            return
+
+        # Summary
+        print("\n📊 Test Summary:")
+        filled_count = sum(1 for v in filled_fields.values() if v)
+        total_fields = len(FIELDS_TO_CHECK)
+        success_rate = (filled_count / total_fields) * 100
+
+        print(f"   Fields filled: {filled_count}/{total_fields} ({success_rate:.1f}%)")
+
+        if success_rate >= 80:
+            print("   🎉 DEMO SYSTEM IS WORKING SUCCESSFULLY!")
+        else:
+            print("   ⚠️  Demo system needs improvement")
+
+        assert filled_fields.get("Company") == expected["Company"]
+        assert success_rate >= 80, f"Only {success_rate:.1f}% of demo fields were filled"
+
+    except Exception as e:
+        print(f"❌ Error during {name} demo test: {e}")
+
+        # Demo UI state, only worth the round-trip when diagnosing a failure.
+        # A failing probe must not replace the error being reported.
+        try:
+            controls_visible = await page.get_by_test_id("demo-controls").count() > 0
+            print(f"🎮 Demo controls visible: {controls_visible}")
+        except Exception as probe_error:
+            print(f"🎮 Demo controls check failed: {probe_error}")
+
+        await page.screenshot(path=f"demo_{name}_error.jpg", **SCREENSHOT_OPTIONS)
+        raise
 
 if __name__ == "__main__":
-    asyncio.run(test_demo_comprehensive())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))